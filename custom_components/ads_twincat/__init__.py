@@ -2,56 +2,66 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
+from typing import Final
 
 import pyads
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    ATTR_CONFIG_ENTRY_ID,
     CONF_DEVICE,
     CONF_IP_ADDRESS,
     CONF_PORT,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_ADS_VAR, DATA_ADS, DOMAIN, AdsType
+from .const import CONF_ADS_VAR, DATA_ADS, DATA_PLATFORMS, DOMAIN, AdsType
 from .hub import AdsHub
 
 _LOGGER = logging.getLogger(__name__)
 
 
-ADS_TYPEMAP = {
-    AdsType.BOOL: pyads.PLCTYPE_BOOL,
-    AdsType.BYTE: pyads.PLCTYPE_BYTE,
-    AdsType.INT: pyads.PLCTYPE_INT,
-    AdsType.UINT: pyads.PLCTYPE_UINT,
-    AdsType.SINT: pyads.PLCTYPE_SINT,
-    AdsType.USINT: pyads.PLCTYPE_USINT,
-    AdsType.DINT: pyads.PLCTYPE_DINT,
-    AdsType.UDINT: pyads.PLCTYPE_UDINT,
-    AdsType.WORD: pyads.PLCTYPE_WORD,
-    AdsType.DWORD: pyads.PLCTYPE_DWORD,
-    AdsType.REAL: pyads.PLCTYPE_REAL,
-    AdsType.LREAL: pyads.PLCTYPE_LREAL,
-    AdsType.STRING: pyads.PLCTYPE_STRING,
-    AdsType.TIME: pyads.PLCTYPE_TIME,
-    AdsType.DATE: pyads.PLCTYPE_DATE,
-    AdsType.DATE_AND_TIME: pyads.PLCTYPE_DT,
-    AdsType.TOD: pyads.PLCTYPE_TOD,
-}
-
 CONF_ADS_FACTOR = "factor"
 CONF_ADS_TYPE = "adstype"
 CONF_ADS_VALUE = "value"
+CONF_ADS_VARIABLES = "variables"
 
 
 SERVICE_WRITE_DATA_BY_NAME = "write_data_by_name"
 
+# Platforms that can be set up from config entry options
+_ALL_PLATFORMS: Final = ("switch", "light", "sensor", "binary_sensor", "cover")
+
+# Connection keys copied from YAML into the imported config entry
+_IMPORT_KEYS = (CONF_DEVICE, CONF_PORT, CONF_IP_ADDRESS)
+
+# Open connections per config entry, tagged with the (net_id, port, ip_address)
+# they were created for, so a reload can reuse the AMS socket
+_CONNECTION_POOL: dict[
+    str, tuple[tuple[str, int, str | None], pyads.Connection]
+] = {}
+# Entries currently being reloaded; their connection is kept open on unload
+_RELOADING: set[str] = set()
+
+# Blocking ADS I/O runs on its own threads, isolated from the shared executor
+_ADS_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _ads_executor() -> ThreadPoolExecutor:
+    """Return the executor for blocking ADS calls, creating it if needed."""
+    global _ADS_EXECUTOR  # noqa: PLW0603
+    if _ADS_EXECUTOR is None:
+        _ADS_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ads")
+    return _ADS_EXECUTOR
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -65,7 +75,7 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
-SCHEMA_SERVICE_WRITE_DATA_BY_NAME = vol.Schema(
+SCHEMA_WRITE_DATA_BY_NAME_ITEM = vol.Schema(
     {
         vol.Required(CONF_ADS_TYPE): vol.Coerce(AdsType),
         vol.Required(CONF_ADS_VALUE): vol.Coerce(int),
@@ -73,6 +83,32 @@ SCHEMA_SERVICE_WRITE_DATA_BY_NAME = vol.Schema(
     }
 )
 
+# Items of the variables list; sum requests take each data type from the PLC
+# symbol, so adstype is accepted but not used
+SCHEMA_WRITE_DATA_BY_NAME_VARIABLE = vol.Schema(
+    {
+        vol.Optional(CONF_ADS_TYPE): vol.Coerce(AdsType),
+        vol.Required(CONF_ADS_VALUE): vol.Coerce(int),
+        vol.Required(CONF_ADS_VAR): cv.string,
+    }
+)
+
+SCHEMA_SERVICE_WRITE_DATA_BY_NAME = vol.Any(
+    SCHEMA_WRITE_DATA_BY_NAME_ITEM.extend(
+        {vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string}
+    ),
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Required(CONF_ADS_VARIABLES): vol.All(
+                cv.ensure_list,
+                [SCHEMA_WRITE_DATA_BY_NAME_VARIABLE],
+                vol.Length(min=1),
+            ),
+        }
+    ),
+)
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the ADS component."""
@@ -87,11 +123,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass.config_entries.flow.async_init(
             DOMAIN,
             context={"source": "import"},
-            data={
-                CONF_DEVICE: conf[CONF_DEVICE],
-                CONF_PORT: conf[CONF_PORT],
-                CONF_IP_ADDRESS: conf.get(CONF_IP_ADDRESS),
-            },
+            data={key: conf.get(key) for key in _IMPORT_KEYS},
         )
     )
 
@@ -104,36 +136,128 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     port = entry.data[CONF_PORT]
     ip_address = entry.data.get(CONF_IP_ADDRESS)
 
-    client = pyads.Connection(net_id, port, ip_address)
+    # Entries created before unique IDs were used get one matching the flow's
+    if entry.unique_id is None:
+        hass.config_entries.async_update_entry(entry, unique_id=f"{net_id}:{port}")
+
+    # Reuse the connection kept open by a reload if it targets the same device
+    key = (net_id, port, ip_address)
+    pooled = _CONNECTION_POOL.get(entry.entry_id)
+    if pooled is not None and pooled[0] == key:
+        client = pooled[1]
+    else:
+        if pooled is not None:
+            await hass.loop.run_in_executor(_ads_executor(), pooled[1].close)
+        client = pyads.Connection(net_id, port, ip_address)
+        _CONNECTION_POOL[entry.entry_id] = (key, client)
 
     # Initialize hub with connection monitoring
     ads_hub = AdsHub(client, hass)
 
-    # Check if connected
-    if not ads_hub.connected:
-        # Try to connect one more time before giving up
-        connected = await hass.async_add_executor_job(ads_hub.check_connection)
-        if not connected:
-            raise ConfigEntryNotReady(f"Could not connect to ADS device {net_id}")
-
-    # Store hub in hass data
-    hass.data[DATA_ADS] = ads_hub
+    # The hub connects on construction; only when that failed, try once more
+    # on the executor before giving up
+    if not ads_hub.connected and not await hass.loop.run_in_executor(
+        _ads_executor(), ads_hub.check_connection
+    ):
+        # Stop this hub's worker and reconnects; the retry builds a new hub
+        await hass.loop.run_in_executor(_ads_executor(), ads_hub.release)
+        # A failed entry is never unloaded, so only a reload keeps its client
+        if entry.entry_id not in _RELOADING:
+            await _async_close_pooled_client(hass, entry.entry_id)
+        raise ConfigEntryNotReady(f"Could not connect to ADS device {net_id}")
+
+    # Store hub in hass data, one per config entry
+    hass.data.setdefault(DATA_ADS, {})[entry.entry_id] = ads_hub
+
+    # Register shutdown handler; closing the connection blocks, so keep it off
+    # the event loop and on the ADS executor
+    async def async_shutdown(event: Event) -> None:
+        """Shut down the ADS connection when Home Assistant stops."""
+        await hass.loop.run_in_executor(_ads_executor(), ads_hub.shutdown)
 
-    # Register shutdown handler
     entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, ads_hub.shutdown)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
     )
 
-    # Register service
+    # Register the service once; the handler looks up the hub on every call so
+    # it keeps following the current hub across reloads
+    if not hass.services.has_service(DOMAIN, SERVICE_WRITE_DATA_BY_NAME):
+        _async_register_services(hass)
+
+    # Group configured entities by type once; each platform takes its own
+    # group from the hub instead of filtering the whole options list
+    entities_by_type = ads_hub.entities_by_type
+    for entity_config in entry.options.get("entities", []):
+        if entity_type := entity_config.get("type"):
+            entities_by_type.setdefault(entity_type, []).append(entity_config)
+
+    # Only forward platforms that have entities configured. Adding an entity
+    # of a new type changes the options, which reloads the entry and picks
+    # the platform up then.
+    platforms = [
+        platform for platform in _ALL_PLATFORMS if platform in entities_by_type
+    ]
+    hass.data.setdefault(DATA_PLATFORMS, {})[entry.entry_id] = platforms
+
+    # Platforms are set up concurrently by Home Assistant
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    # Register update listener to handle options changes
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    return True
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the ADS services."""
+    log_error = _LOGGER.error
+
+    def write_values(ads_hub: AdsHub, values: dict[str, int]) -> None:
+        """Write values in one ADS sum request and log the failures."""
+        results = ads_hub.write_list_by_name(values)
+        if results is None:
+            log_error("Failed to write to ADS variables %s", ", ".join(values))
+            return
+        for name, status in results.items():
+            if status != "no error":
+                log_error("Failed to write to ADS variable %s: %s", name, status)
+
     def handle_write_data_by_name(call: ServiceCall) -> None:
         """Write a value to the connected ADS device."""
-        ads_var: str = call.data[CONF_ADS_VAR]
-        ads_type: AdsType = call.data[CONF_ADS_TYPE]
-        value: int = call.data[CONF_ADS_VALUE]
-
-        result = ads_hub.write_by_name(ads_var, value, ADS_TYPEMAP[ads_type])
+        hubs = hass.data.get(DATA_ADS)
+        if not hubs:
+            log_error("Cannot write to ADS: no ADS device is loaded")
+            return
+
+        data = call.data
+        # Without a target config entry, write to the first loaded device
+        if (entry_id := data.get(ATTR_CONFIG_ENTRY_ID)) is None:
+            ads_hub = next(iter(hubs.values()))
+        elif (ads_hub := hubs.get(entry_id)) is None:
+            log_error("Cannot write to ADS: config entry %s is not loaded", entry_id)
+            return
+
+        if CONF_ADS_VARIABLES in data:
+            # Batch the writes into ADS sum requests, in the order given. A sum
+            # request writes each variable once, so a repeated variable starts
+            # the next request and every listed value gets written.
+            values: dict[str, int] = {}
+            for item in data[CONF_ADS_VARIABLES]:
+                if item[CONF_ADS_VAR] in values:
+                    write_values(ads_hub, values)
+                    values = {}
+                values[item[CONF_ADS_VAR]] = item[CONF_ADS_VALUE]
+            write_values(ads_hub, values)
+            return
+
+        ads_var: str = data[CONF_ADS_VAR]
+        ads_type: AdsType = data[CONF_ADS_TYPE]
+        value: int = data[CONF_ADS_VALUE]
+
+        result = ads_hub.write_by_name(ads_var, value, ads_type.plc_type)
         if result is None:
-            _LOGGER.error("Failed to write to ADS variable %s", ads_var)
+            log_error("Failed to write to ADS variable %s", ads_var)
 
     hass.services.async_register(
         DOMAIN,
@@ -142,47 +266,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         schema=SCHEMA_SERVICE_WRITE_DATA_BY_NAME,
     )
 
-    # Forward setup to platforms based on configured entities
-    entities = entry.options.get("entities", [])
-    platforms_to_load = set()
-
-    for entity_config in entities:
-        entity_type = entity_config.get("type")
-        if entity_type:
-            platforms_to_load.add(entity_type)
-
-    # Always load platforms even if no entities configured yet (for future additions)
-    # This allows the platforms to set up async_setup_entry which can be called later
-    all_platforms = ["switch", "light", "sensor", "binary_sensor", "cover"]
-
-    await hass.config_entries.async_forward_entry_setups(entry, all_platforms)
-
-    # Register update listener to handle options changes
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
-
-    return True
-
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    _RELOADING.add(entry.entry_id)
+    try:
+        await hass.config_entries.async_reload(entry.entry_id)
+    finally:
+        _RELOADING.discard(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload an ADS config entry."""
-    # Unload all platforms
-    all_platforms = ["switch", "light", "sensor", "binary_sensor", "cover"]
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, all_platforms)
+    # Unload the platforms that were forwarded during setup
+    platforms = hass.data[DATA_PLATFORMS].get(entry.entry_id, [])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
 
     if unload_ok:
-        ads_hub: AdsHub = hass.data.get(DATA_ADS)
+        hass.data[DATA_PLATFORMS].pop(entry.entry_id, None)
+        ads_hub = hass.data[DATA_ADS].pop(entry.entry_id, None)
 
         if ads_hub:
-            await hass.async_add_executor_job(ads_hub.shutdown)
-            hass.data.pop(DATA_ADS, None)
-
-        # Remove service if this is the last entry
-        if not hass.config_entries.async_loaded_entries(DOMAIN):
+            if entry.entry_id in _RELOADING:
+                # Keep the connection open for the upcoming setup
+                await hass.loop.run_in_executor(_ads_executor(), ads_hub.release)
+            else:
+                await hass.loop.run_in_executor(_ads_executor(), ads_hub.shutdown)
+                _CONNECTION_POOL.pop(entry.entry_id, None)
+
+        # Remove service if this is the last entry; every loaded entry has its
+        # platforms recorded, so an empty mapping means none are left
+        if not hass.data[DATA_PLATFORMS]:
             hass.services.async_remove(DOMAIN, SERVICE_WRITE_DATA_BY_NAME)
+            _async_shutdown_executor(entry)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close the connection of a removed entry that was not unloaded."""
+    await _async_close_pooled_client(hass, entry.entry_id)
+    if not hass.data.get(DATA_PLATFORMS):
+        _async_shutdown_executor(entry)
+
+
+async def _async_close_pooled_client(hass: HomeAssistant, entry_id: str) -> None:
+    """Close and forget the pooled connection of a config entry."""
+    if (pooled := _CONNECTION_POOL.pop(entry_id, None)) is not None:
+        await hass.loop.run_in_executor(_ads_executor(), pooled[1].close)
+
+
+def _async_shutdown_executor(entry: ConfigEntry) -> None:
+    """Stop the ADS executor once the last entry is gone for good."""
+    global _ADS_EXECUTOR  # noqa: PLW0603
+    if _ADS_EXECUTOR is not None and entry.entry_id not in _RELOADING:
+        _ADS_EXECUTOR.shutdown(wait=False)
+        _ADS_EXECUTOR = None
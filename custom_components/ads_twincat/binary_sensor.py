@@ -39,7 +39,8 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the Binary Sensor platform for ADS (legacy YAML config)."""
-    ads_hub = hass.data[DATA_ADS]
+    # Legacy YAML platforms use the first configured ADS device
+    ads_hub = next(iter(hass.data[DATA_ADS].values()))
 
     ads_var: str = config[CONF_ADS_VAR]
     name: str = config[CONF_NAME]
@@ -55,13 +56,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ADS binary sensor entities from config entry."""
-    ads_hub = hass.data[DATA_ADS]
+    ads_hub = hass.data[DATA_ADS][entry.entry_id]
     
-    # Get configured entities from options
-    entities = entry.options.get("entities", [])
-    
-    # Filter for binary sensor entities
-    binary_sensor_configs = [e for e in entities if e.get("type") == "binary_sensor"]
+    # Entities configured in options, grouped by type during entry setup
+    binary_sensor_configs = ads_hub.entities_by_type.get("binary_sensor", [])
     
     # Create binary sensor entities
     binary_sensors = []
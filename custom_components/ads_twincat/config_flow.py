@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from asyncio import timeout
+from collections.abc import Awaitable, Callable
 import logging
-from typing import Any
+from operator import itemgetter
+import re
+from time import monotonic
+from typing import Any, Final
 
 import pyads
 import voluptuous as vol
@@ -31,47 +36,294 @@ from .const import CONF_ADS_VAR, DEFAULT_PORT, DOMAIN, AdsType
 _LOGGER = logging.getLogger(__name__)
 
 # Config entry option keys
-CONF_ENTITIES = "entities"
-CONF_ENTITY_ID = "entity_id"
-CONF_ADS_TYPE = "adstype"
-CONF_ADS_VAR_BRIGHTNESS = "adsvar_brightness"
-CONF_ADS_VAR_POSITION = "adsvar_position"
-CONF_ADS_VAR_SET_POSITION = "adsvar_set_position"
-CONF_ADS_VAR_OPEN = "adsvar_open"
-CONF_ADS_VAR_CLOSE = "adsvar_close"
-CONF_ADS_VAR_STOP = "adsvar_stop"
-CONF_ADS_FACTOR = "factor"
-CONF_STATE_CLASS = "state_class"
+CONF_ENTITIES: Final = "entities"
+CONF_ENTITY_ID: Final = "entity_id"
+CONF_ADS_TYPE: Final = "adstype"
+CONF_ADS_VAR_BRIGHTNESS: Final = "adsvar_brightness"
+CONF_ADS_VAR_POSITION: Final = "adsvar_position"
+CONF_ADS_VAR_SET_POSITION: Final = "adsvar_set_position"
+CONF_ADS_VAR_OPEN: Final = "adsvar_open"
+CONF_ADS_VAR_CLOSE: Final = "adsvar_close"
+CONF_ADS_VAR_STOP: Final = "adsvar_stop"
+CONF_ADS_FACTOR: Final = "factor"
+CONF_STATE_CLASS: Final = "state_class"
 
 # Entity types
-ENTITY_TYPE_SWITCH = "switch"
-ENTITY_TYPE_LIGHT = "light"
-ENTITY_TYPE_SENSOR = "sensor"
-ENTITY_TYPE_BINARY_SENSOR = "binary_sensor"
-ENTITY_TYPE_COVER = "cover"
+ENTITY_TYPE_SWITCH: Final = "switch"
+ENTITY_TYPE_LIGHT: Final = "light"
+ENTITY_TYPE_SENSOR: Final = "sensor"
+ENTITY_TYPE_BINARY_SENSOR: Final = "binary_sensor"
+ENTITY_TYPE_COVER: Final = "cover"
 
-ENTITY_TYPES = [
+ENTITY_TYPES: Final = (
     ENTITY_TYPE_SWITCH,
     ENTITY_TYPE_LIGHT,
     ENTITY_TYPE_SENSOR,
     ENTITY_TYPE_BINARY_SENSOR,
     ENTITY_TYPE_COVER,
-]
+)
+
+# Six dot-separated groups of one to three digits
+_NET_ID_RE = re.compile(r"(?:[0-9]{1,3}\.){5}[0-9]{1,3}")
+
+# Seconds a successful connection probe is trusted, and the probe time limit
+PROBE_CACHE_TTL: Final = 30
+PROBE_TIMEOUT: Final = 5
+
+# Monotonic time of the last successful probe per (net_id, port, ip_address)
+_PROBE_CACHE: dict[tuple[str, int, str | None], float] = {}
+
+_ADS_TYPE_LABELS: Final = {
+    AdsType.BOOL: "Boolean",
+    AdsType.BYTE: "Byte",
+    AdsType.INT: "Integer (16-bit)",
+    AdsType.UINT: "Unsigned Integer (16-bit)",
+    AdsType.SINT: "Short Integer (8-bit)",
+    AdsType.USINT: "Unsigned Short Integer (8-bit)",
+    AdsType.DINT: "Double Integer (32-bit)",
+    AdsType.UDINT: "Unsigned Double Integer (32-bit)",
+    AdsType.WORD: "Word (16-bit)",
+    AdsType.DWORD: "Double Word (32-bit)",
+    AdsType.REAL: "Real (32-bit float)",
+    AdsType.LREAL: "Long Real (64-bit float)",
+}
+# vol.In only keeps a reference to its container, so one validator is shared
+_ADS_TYPE_VALIDATOR = vol.In(_ADS_TYPE_LABELS)
+
+_ENTITY_TYPE_LABELS = {
+    ENTITY_TYPE_SWITCH: "Switch",
+    ENTITY_TYPE_LIGHT: "Light",
+    ENTITY_TYPE_SENSOR: "Sensor",
+    ENTITY_TYPE_BINARY_SENSOR: "Binary Sensor",
+    ENTITY_TYPE_COVER: "Cover",
+}
+
+# Options flow main menu entries
+_MENU_OPTIONS: Final = ("add_entity", "edit_entity", "remove_entity", "finish")
+
+# Schemas that do not depend on previous input are built once
+STEP_USER_DATA_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE): cv.string,
+        vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
+        vol.Optional(CONF_IP_ADDRESS): cv.string,
+    }
+)
+
+ADD_ENTITY_SCHEMA: Final = vol.Schema(
+    {
+        vol.Required(CONF_TYPE): vol.In(_ENTITY_TYPE_LABELS),
+    }
+)
+
+
+def _switch_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Return the switch form schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
+            vol.Required(
+                CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
+            ): cv.string,
+        }
+    )
+
+
+def _light_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Return the light form schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
+            vol.Required(
+                CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR_BRIGHTNESS,
+                default=defaults.get(CONF_ADS_VAR_BRIGHTNESS, ""),
+            ): cv.string,
+        }
+    )
+
+
+def _sensor_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Return the sensor form schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
+            vol.Required(
+                CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
+            ): cv.string,
+            vol.Required(
+                CONF_ADS_TYPE, default=defaults.get(CONF_ADS_TYPE, AdsType.INT)
+            ): _ADS_TYPE_VALIDATOR,
+            vol.Optional(
+                CONF_UNIT_OF_MEASUREMENT,
+                default=defaults.get(CONF_UNIT_OF_MEASUREMENT, ""),
+            ): cv.string,
+            vol.Optional(
+                CONF_DEVICE_CLASS, default=defaults.get(CONF_DEVICE_CLASS, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_STATE_CLASS, default=defaults.get(CONF_STATE_CLASS, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_FACTOR, default=defaults.get(CONF_ADS_FACTOR, "")
+            ): cv.string,
+        }
+    )
+
+
+def _binary_sensor_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Return the binary sensor form schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
+            vol.Required(
+                CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_DEVICE_CLASS, default=defaults.get(CONF_DEVICE_CLASS, "")
+            ): cv.string,
+        }
+    )
+
+
+def _cover_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Return the cover form schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR_POSITION,
+                default=defaults.get(CONF_ADS_VAR_POSITION, ""),
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR_SET_POSITION,
+                default=defaults.get(CONF_ADS_VAR_SET_POSITION, ""),
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR_OPEN, default=defaults.get(CONF_ADS_VAR_OPEN, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR_CLOSE, default=defaults.get(CONF_ADS_VAR_CLOSE, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_ADS_VAR_STOP, default=defaults.get(CONF_ADS_VAR_STOP, "")
+            ): cv.string,
+            vol.Optional(
+                CONF_DEVICE_CLASS, default=defaults.get(CONF_DEVICE_CLASS, "")
+            ): cv.string,
+        }
+    )
+
+
+# Fields shown for each stored entity in the edit/remove selection
+_CHOICE_ITEMS = itemgetter(CONF_NAME, CONF_TYPE)
+
+# Fields stored per entity type: (always copied, copied only when non-empty)
+_ENTITY_FIELDS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    ENTITY_TYPE_SWITCH: ((CONF_ADS_VAR,), ()),
+    ENTITY_TYPE_LIGHT: ((CONF_ADS_VAR,), (CONF_ADS_VAR_BRIGHTNESS,)),
+    ENTITY_TYPE_SENSOR: (
+        (CONF_ADS_VAR, CONF_ADS_TYPE),
+        (
+            CONF_UNIT_OF_MEASUREMENT,
+            CONF_DEVICE_CLASS,
+            CONF_STATE_CLASS,
+            CONF_ADS_FACTOR,
+        ),
+    ),
+    ENTITY_TYPE_BINARY_SENSOR: ((CONF_ADS_VAR,), (CONF_DEVICE_CLASS,)),
+    ENTITY_TYPE_COVER: (
+        (),
+        (
+            CONF_ADS_VAR,
+            CONF_ADS_VAR_POSITION,
+            CONF_ADS_VAR_SET_POSITION,
+            CONF_ADS_VAR_OPEN,
+            CONF_ADS_VAR_CLOSE,
+            CONF_ADS_VAR_STOP,
+            CONF_DEVICE_CLASS,
+        ),
+    ),
+}
+
+# Forms for new entities have no defaults, so their schemas are built once
+SWITCH_SCHEMA: Final = _switch_schema({})
+LIGHT_SCHEMA: Final = _light_schema({})
+SENSOR_SCHEMA: Final = _sensor_schema({})
+BINARY_SENSOR_SCHEMA: Final = _binary_sensor_schema({})
+COVER_SCHEMA: Final = _cover_schema({})
+
+# Form schema builder and prebuilt add-mode schema per entity type
+_ENTITY_SCHEMAS: dict[
+    str, tuple[Callable[[dict[str, Any]], vol.Schema], vol.Schema]
+] = {
+    ENTITY_TYPE_SWITCH: (_switch_schema, SWITCH_SCHEMA),
+    ENTITY_TYPE_LIGHT: (_light_schema, LIGHT_SCHEMA),
+    ENTITY_TYPE_SENSOR: (_sensor_schema, SENSOR_SCHEMA),
+    ENTITY_TYPE_BINARY_SENSOR: (_binary_sensor_schema, BINARY_SENSOR_SCHEMA),
+    ENTITY_TYPE_COVER: (_cover_schema, COVER_SCHEMA),
+}
+
+
+def _slugify(name: str) -> str:
+    """Return the entity ID derived from an entity name."""
+    # str.lower() is Unicode aware, so names like "Łazienka" keep stable IDs
+    return name.lower().replace(" ", "_")
+
+
+def _key_entities(entities: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Return the stored entities keyed by entity ID.
+
+    Older versions could store two entities with the same ID; the later ones are
+    keyed with a numeric suffix so saving the options keeps all of them.
+    """
+    keyed: dict[str, dict[str, Any]] = {}
+    taken = {entity[CONF_ENTITY_ID] for entity in entities}
+    for entity in entities:
+        key = entity[CONF_ENTITY_ID]
+        if key in keyed:
+            suffix = 2
+            while f"{key}_{suffix}" in taken:
+                suffix += 1
+            key = f"{key}_{suffix}"
+            taken.add(key)
+        keyed[key] = entity
+    return keyed
+
+
+def _build_title(data: dict[str, Any]) -> str:
+    """Return the config entry title for the given connection data."""
+    if ip_address := data.get(CONF_IP_ADDRESS):
+        return f"ADS TwinCAT {data[CONF_DEVICE]} ({ip_address})"
+    return f"ADS TwinCAT {data[CONF_DEVICE]}"
+
+
+def _unique_id(data: dict[str, Any]) -> str:
+    """Return the config entry unique ID for the given connection data."""
+    return f"{data[CONF_DEVICE]}:{data[CONF_PORT]}"
 
 
 def validate_net_id(net_id: str) -> bool:
     """Validate ADS Net ID format (x.x.x.x.x.x)."""
-    parts = net_id.split(".")
-    if len(parts) != 6:
+    if _NET_ID_RE.fullmatch(net_id) is None:
         return False
+    return max(map(int, net_id.split("."))) <= 255
+
+
+def _probe_connection(net_id: str, port: int, ip_address: str | None) -> None:
+    """Open a connection, read the ADS state and close it again."""
+    client = pyads.Connection(net_id, port, ip_address)
+    client.open()
     try:
-        for part in parts:
-            num = int(part)
-            if num < 0 or num > 255:
-                return False
-        return True
-    except ValueError:
-        return False
+        # Test connection by reading ADS state
+        client.read_state()
+    finally:
+        client.close()
 
 
 async def validate_connection(
@@ -89,21 +341,29 @@ async def validate_connection(
         errors["base"] = "invalid_net_id"
         return errors
 
-    # Try to connect to ADS device
+    # Skip the probe if the same device answered recently
+    key = (net_id, port, ip_address)
+    last_success = _PROBE_CACHE.get(key)
+    if last_success is not None and monotonic() - last_success < PROBE_CACHE_TTL:
+        return None
+
+    # Try to connect to ADS device, in a single executor job
     try:
-        client = pyads.Connection(net_id, port, ip_address)
-        await hass.async_add_executor_job(client.open)
-        try:
-            # Test connection by reading ADS state
-            await hass.async_add_executor_job(client.read_state)
-        finally:
-            await hass.async_add_executor_job(client.close)
+        async with timeout(PROBE_TIMEOUT):
+            await hass.async_add_executor_job(
+                _probe_connection, net_id, port, ip_address
+            )
     except pyads.ADSError as err:
         _LOGGER.error("Failed to connect to ADS device: %s", err)
         errors["base"] = "cannot_connect"
+    except TimeoutError:
+        _LOGGER.error("Timed out connecting to ADS device %s", net_id)
+        errors["base"] = "cannot_connect"
     except Exception:
         _LOGGER.exception("Unexpected error during connection test")
         errors["base"] = "unknown"
+    else:
+        _PROBE_CACHE[key] = monotonic()
 
     return errors if errors else None
 
@@ -121,7 +381,10 @@ class AdsConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Check for duplicate entry
+            # Check for duplicate entry; entries not yet migrated have no
+            # unique ID, so their data is compared too
+            await self.async_set_unique_id(_unique_id(user_input))
+            self._abort_if_unique_id_configured()
             self._async_abort_entries_match(
                 {
                     CONF_DEVICE: user_input[CONF_DEVICE],
@@ -135,33 +398,26 @@ class AdsConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors = validation_errors
             else:
                 # Create entry
-                title = f"ADS TwinCAT {user_input[CONF_DEVICE]}"
-                if user_input.get(CONF_IP_ADDRESS):
-                    title += f" ({user_input[CONF_IP_ADDRESS]})"
-
                 return self.async_create_entry(
-                    title=title,
+                    title=_build_title(user_input),
                     data=user_input,
                 )
 
         # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_DEVICE): cv.string,
-                vol.Required(CONF_PORT, default=DEFAULT_PORT): cv.port,
-                vol.Optional(CONF_IP_ADDRESS): cv.string,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
     async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
         """Handle import from YAML configuration."""
-        # Check if already configured
+        # Check if already configured; keep the IP address in sync with YAML
+        await self.async_set_unique_id(_unique_id(import_data))
+        self._abort_if_unique_id_configured(
+            updates={CONF_IP_ADDRESS: import_data.get(CONF_IP_ADDRESS)}
+        )
+        # The import runs before setup migrates entries without a unique ID
         self._async_abort_entries_match(
             {
                 CONF_DEVICE: import_data[CONF_DEVICE],
@@ -178,12 +434,8 @@ class AdsConfigFlow(ConfigFlow, domain=DOMAIN):
             return self.async_abort(reason="cannot_connect")
 
         # Create entry from YAML import
-        title = f"ADS TwinCAT {import_data[CONF_DEVICE]}"
-        if import_data.get(CONF_IP_ADDRESS):
-            title += f" ({import_data[CONF_IP_ADDRESS]})"
-
         return self.async_create_entry(
-            title=title,
+            title=_build_title(import_data),
             data=import_data,
         )
 
@@ -197,19 +449,33 @@ class AdsConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # Check for another entry using this device before probing it; the
+            # Net ID may change, so the entry's own unique ID is updated below
+            unique_id = _unique_id(user_input)
+            other = self.hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, unique_id
+            )
+            if other is not None and other.entry_id != entry.entry_id:
+                return self.async_abort(reason="already_configured")
+            # Entries not yet migrated have no unique ID; compare their data
+            if any(
+                other.entry_id != entry.entry_id
+                and other.data[CONF_DEVICE] == user_input[CONF_DEVICE]
+                and other.data[CONF_PORT] == user_input[CONF_PORT]
+                for other in self._async_current_entries(include_ignore=False)
+            ):
+                return self.async_abort(reason="already_configured")
+
             # Validate connection
             validation_errors = await validate_connection(self.hass, user_input)
             if validation_errors:
                 errors = validation_errors
             else:
                 # Update entry
-                title = f"ADS TwinCAT {user_input[CONF_DEVICE]}"
-                if user_input.get(CONF_IP_ADDRESS):
-                    title += f" ({user_input[CONF_IP_ADDRESS]})"
-
                 return self.async_update_reload_and_abort(
                     entry,
-                    title=title,
+                    unique_id=unique_id,
+                    title=_build_title(user_input),
                     data=user_input,
                 )
 
@@ -246,11 +512,39 @@ class AdsOptionsFlowHandler(OptionsFlow):
         """Initialize options flow."""
         self._config_entry = config_entry
         # Load existing entities from options once during init
-        self._entities: list[dict[str, Any]] = list(
+        # Keyed by entity ID for O(1) lookups; dicts keep the stored order
+        self._entities: dict[str, dict[str, Any]] = _key_entities(
             config_entry.options.get(CONF_ENTITIES, [])
         )
         self._entity_to_edit: dict[str, Any] | None = None
-        self._entity_index: int | None = None
+        # ID of the entity being edited, None when adding
+        self._entity_id_to_edit: str | None = None
+        # Configuration step for each entity type
+        self._configure_steps: dict[
+            str, Callable[[], Awaitable[ConfigFlowResult]]
+        ] = {
+            ENTITY_TYPE_SWITCH: self.async_step_configure_switch,
+            ENTITY_TYPE_LIGHT: self.async_step_configure_light,
+            ENTITY_TYPE_SENSOR: self.async_step_configure_sensor,
+            ENTITY_TYPE_BINARY_SENSOR: self.async_step_configure_binary_sensor,
+            ENTITY_TYPE_COVER: self.async_step_configure_cover,
+        }
+
+    def _edit_defaults(self, keys: tuple[str, ...]) -> dict[str, Any]:
+        """Return the stored values of the entity being edited, if any."""
+        if self._entity_to_edit and self._entity_id_to_edit is not None:
+            # Keys missing from the entity fall back to the schema's defaults
+            entity = self._entity_to_edit
+            return {key: entity[key] for key in keys if key in entity}
+        return {}
+
+    def _build_entity_choices(self) -> dict[str, str]:
+        """Return the entity selection shown in the edit and remove steps."""
+        # Saved entities always carry an ID, name and type
+        return {
+            key: "{} ({})".format(*_CHOICE_ITEMS(entity))
+            for key, entity in self._entities.items()
+        }
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -258,14 +552,16 @@ class AdsOptionsFlowHandler(OptionsFlow):
         """Manage the ADS options - main menu."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["add_entity", "edit_entity", "remove_entity", "finish"],
+            menu_options=_MENU_OPTIONS,
         )
 
     async def async_step_finish(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Finish options flow."""
-        return self.async_create_entry(data={CONF_ENTITIES: self._entities})
+        return self.async_create_entry(
+            data={CONF_ENTITIES: list(self._entities.values())}
+        )
 
     async def async_step_add_entity(
         self, user_input: dict[str, Any] | None = None
@@ -279,35 +575,13 @@ class AdsOptionsFlowHandler(OptionsFlow):
             self._entity_to_edit = {CONF_TYPE: entity_type}
             
             # Route to appropriate configuration step
-            if entity_type == ENTITY_TYPE_SWITCH:
-                return await self.async_step_configure_switch()
-            if entity_type == ENTITY_TYPE_LIGHT:
-                return await self.async_step_configure_light()
-            if entity_type == ENTITY_TYPE_SENSOR:
-                return await self.async_step_configure_sensor()
-            if entity_type == ENTITY_TYPE_BINARY_SENSOR:
-                return await self.async_step_configure_binary_sensor()
-            if entity_type == ENTITY_TYPE_COVER:
-                return await self.async_step_configure_cover()
+            if configure_step := self._configure_steps.get(entity_type):
+                return await configure_step()
 
         # Show entity type selection
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_TYPE): vol.In(
-                    {
-                        ENTITY_TYPE_SWITCH: "Switch",
-                        ENTITY_TYPE_LIGHT: "Light",
-                        ENTITY_TYPE_SENSOR: "Sensor",
-                        ENTITY_TYPE_BINARY_SENSOR: "Binary Sensor",
-                        ENTITY_TYPE_COVER: "Cover",
-                    }
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="add_entity",
-            data_schema=data_schema,
+            data_schema=ADD_ENTITY_SCHEMA,
             errors=errors,
         )
 
@@ -315,405 +589,89 @@ class AdsOptionsFlowHandler(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure a switch entity."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            # Validate unique entity name
-            entity_id = user_input[CONF_NAME].lower().replace(" ", "_")
-            if self._entity_index is None and any(
-                e.get(CONF_ENTITY_ID) == entity_id for e in self._entities
-            ):
-                errors[CONF_NAME] = "entity_exists"
-            else:
-                # Build entity configuration
-                entity_config = {
-                    CONF_TYPE: ENTITY_TYPE_SWITCH,
-                    CONF_ENTITY_ID: entity_id,
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_ADS_VAR: user_input[CONF_ADS_VAR],
-                }
-                
-                if self._entity_index is not None:
-                    # Edit existing entity
-                    self._entities[self._entity_index] = entity_config
-                else:
-                    # Add new entity
-                    self._entities.append(entity_config)
-                
-                # Reset state and go back to menu
-                self._entity_to_edit = None
-                self._entity_index = None
-                return await self.async_step_init()
-
-        # Get defaults for edit mode
-        defaults = {}
-        if self._entity_to_edit and self._entity_index is not None:
-            defaults = {
-                CONF_NAME: self._entity_to_edit.get(CONF_NAME, ""),
-                CONF_ADS_VAR: self._entity_to_edit.get(CONF_ADS_VAR, ""),
-            }
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
-                vol.Required(
-                    CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
-                ): cv.string,
-            }
-        )
-
-        return self.async_show_form(
-            step_id="configure_switch",
-            data_schema=data_schema,
-            errors=errors,
-        )
+        return await self._async_step_configure(ENTITY_TYPE_SWITCH, user_input)
 
     async def async_step_configure_light(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure a light entity."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            # Validate unique entity name
-            entity_id = user_input[CONF_NAME].lower().replace(" ", "_")
-            if self._entity_index is None and any(
-                e.get(CONF_ENTITY_ID) == entity_id for e in self._entities
-            ):
-                errors[CONF_NAME] = "entity_exists"
-            else:
-                # Build entity configuration
-                entity_config = {
-                    CONF_TYPE: ENTITY_TYPE_LIGHT,
-                    CONF_ENTITY_ID: entity_id,
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_ADS_VAR: user_input[CONF_ADS_VAR],
-                }
-                
-                # Add optional brightness variable
-                if user_input.get(CONF_ADS_VAR_BRIGHTNESS):
-                    entity_config[CONF_ADS_VAR_BRIGHTNESS] = user_input[
-                        CONF_ADS_VAR_BRIGHTNESS
-                    ]
-                
-                if self._entity_index is not None:
-                    # Edit existing entity
-                    self._entities[self._entity_index] = entity_config
-                else:
-                    # Add new entity
-                    self._entities.append(entity_config)
-                
-                # Reset state and go back to menu
-                self._entity_to_edit = None
-                self._entity_index = None
-                return await self.async_step_init()
-
-        # Get defaults for edit mode
-        defaults = {}
-        if self._entity_to_edit and self._entity_index is not None:
-            defaults = {
-                CONF_NAME: self._entity_to_edit.get(CONF_NAME, ""),
-                CONF_ADS_VAR: self._entity_to_edit.get(CONF_ADS_VAR, ""),
-                CONF_ADS_VAR_BRIGHTNESS: self._entity_to_edit.get(
-                    CONF_ADS_VAR_BRIGHTNESS, ""
-                ),
-            }
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
-                vol.Required(
-                    CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR_BRIGHTNESS,
-                    default=defaults.get(CONF_ADS_VAR_BRIGHTNESS, ""),
-                ): cv.string,
-            }
-        )
-
-        return self.async_show_form(
-            step_id="configure_light",
-            data_schema=data_schema,
-            errors=errors,
-        )
+        return await self._async_step_configure(ENTITY_TYPE_LIGHT, user_input)
 
     async def async_step_configure_sensor(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure a sensor entity."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            # Validate unique entity name
-            entity_id = user_input[CONF_NAME].lower().replace(" ", "_")
-            if self._entity_index is None and any(
-                e.get(CONF_ENTITY_ID) == entity_id for e in self._entities
-            ):
-                errors[CONF_NAME] = "entity_exists"
-            else:
-                # Build entity configuration
-                entity_config = {
-                    CONF_TYPE: ENTITY_TYPE_SENSOR,
-                    CONF_ENTITY_ID: entity_id,
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_ADS_VAR: user_input[CONF_ADS_VAR],
-                    CONF_ADS_TYPE: user_input[CONF_ADS_TYPE],
-                }
-                
-                # Add optional fields
-                if user_input.get(CONF_UNIT_OF_MEASUREMENT):
-                    entity_config[CONF_UNIT_OF_MEASUREMENT] = user_input[
-                        CONF_UNIT_OF_MEASUREMENT
-                    ]
-                if user_input.get(CONF_DEVICE_CLASS):
-                    entity_config[CONF_DEVICE_CLASS] = user_input[CONF_DEVICE_CLASS]
-                if user_input.get(CONF_STATE_CLASS):
-                    entity_config[CONF_STATE_CLASS] = user_input[CONF_STATE_CLASS]
-                if user_input.get(CONF_ADS_FACTOR):
-                    entity_config[CONF_ADS_FACTOR] = user_input[CONF_ADS_FACTOR]
-                
-                if self._entity_index is not None:
-                    # Edit existing entity
-                    self._entities[self._entity_index] = entity_config
-                else:
-                    # Add new entity
-                    self._entities.append(entity_config)
-                
-                # Reset state and go back to menu
-                self._entity_to_edit = None
-                self._entity_index = None
-                return await self.async_step_init()
-
-        # Get defaults for edit mode
-        defaults = {}
-        if self._entity_to_edit and self._entity_index is not None:
-            defaults = {
-                CONF_NAME: self._entity_to_edit.get(CONF_NAME, ""),
-                CONF_ADS_VAR: self._entity_to_edit.get(CONF_ADS_VAR, ""),
-                CONF_ADS_TYPE: self._entity_to_edit.get(CONF_ADS_TYPE, AdsType.INT),
-                CONF_UNIT_OF_MEASUREMENT: self._entity_to_edit.get(
-                    CONF_UNIT_OF_MEASUREMENT, ""
-                ),
-                CONF_DEVICE_CLASS: self._entity_to_edit.get(CONF_DEVICE_CLASS, ""),
-                CONF_STATE_CLASS: self._entity_to_edit.get(CONF_STATE_CLASS, ""),
-                CONF_ADS_FACTOR: self._entity_to_edit.get(CONF_ADS_FACTOR, ""),
-            }
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
-                vol.Required(
-                    CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
-                ): cv.string,
-                vol.Required(
-                    CONF_ADS_TYPE, default=defaults.get(CONF_ADS_TYPE, AdsType.INT)
-                ): vol.In(
-                    {
-                        AdsType.BOOL: "Boolean",
-                        AdsType.BYTE: "Byte",
-                        AdsType.INT: "Integer (16-bit)",
-                        AdsType.UINT: "Unsigned Integer (16-bit)",
-                        AdsType.SINT: "Short Integer (8-bit)",
-                        AdsType.USINT: "Unsigned Short Integer (8-bit)",
-                        AdsType.DINT: "Double Integer (32-bit)",
-                        AdsType.UDINT: "Unsigned Double Integer (32-bit)",
-                        AdsType.WORD: "Word (16-bit)",
-                        AdsType.DWORD: "Double Word (32-bit)",
-                        AdsType.REAL: "Real (32-bit float)",
-                        AdsType.LREAL: "Long Real (64-bit float)",
-                    }
-                ),
-                vol.Optional(
-                    CONF_UNIT_OF_MEASUREMENT,
-                    default=defaults.get(CONF_UNIT_OF_MEASUREMENT, ""),
-                ): cv.string,
-                vol.Optional(
-                    CONF_DEVICE_CLASS, default=defaults.get(CONF_DEVICE_CLASS, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_STATE_CLASS, default=defaults.get(CONF_STATE_CLASS, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_FACTOR, default=defaults.get(CONF_ADS_FACTOR, "")
-                ): cv.string,
-            }
-        )
-
-        return self.async_show_form(
-            step_id="configure_sensor",
-            data_schema=data_schema,
-            errors=errors,
-        )
+        return await self._async_step_configure(ENTITY_TYPE_SENSOR, user_input)
 
     async def async_step_configure_binary_sensor(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure a binary sensor entity."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            # Validate unique entity name
-            entity_id = user_input[CONF_NAME].lower().replace(" ", "_")
-            if self._entity_index is None and any(
-                e.get(CONF_ENTITY_ID) == entity_id for e in self._entities
-            ):
-                errors[CONF_NAME] = "entity_exists"
-            else:
-                # Build entity configuration
-                entity_config = {
-                    CONF_TYPE: ENTITY_TYPE_BINARY_SENSOR,
-                    CONF_ENTITY_ID: entity_id,
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_ADS_VAR: user_input[CONF_ADS_VAR],
-                }
-                
-                # Add optional device class
-                if user_input.get(CONF_DEVICE_CLASS):
-                    entity_config[CONF_DEVICE_CLASS] = user_input[CONF_DEVICE_CLASS]
-                
-                if self._entity_index is not None:
-                    # Edit existing entity
-                    self._entities[self._entity_index] = entity_config
-                else:
-                    # Add new entity
-                    self._entities.append(entity_config)
-                
-                # Reset state and go back to menu
-                self._entity_to_edit = None
-                self._entity_index = None
-                return await self.async_step_init()
-
-        # Get defaults for edit mode
-        defaults = {}
-        if self._entity_to_edit and self._entity_index is not None:
-            defaults = {
-                CONF_NAME: self._entity_to_edit.get(CONF_NAME, ""),
-                CONF_ADS_VAR: self._entity_to_edit.get(CONF_ADS_VAR, ""),
-                CONF_DEVICE_CLASS: self._entity_to_edit.get(CONF_DEVICE_CLASS, ""),
-            }
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
-                vol.Required(
-                    CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_DEVICE_CLASS, default=defaults.get(CONF_DEVICE_CLASS, "")
-                ): cv.string,
-            }
-        )
-
-        return self.async_show_form(
-            step_id="configure_binary_sensor",
-            data_schema=data_schema,
-            errors=errors,
-        )
+        return await self._async_step_configure(ENTITY_TYPE_BINARY_SENSOR, user_input)
 
     async def async_step_configure_cover(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Configure a cover entity."""
+        return await self._async_step_configure(ENTITY_TYPE_COVER, user_input)
+
+    async def _async_step_configure(
+        self, entity_type: str, user_input: dict[str, Any] | None
+    ) -> ConfigFlowResult:
+        """Show or save the configuration form of an entity type."""
         errors: dict[str, str] = {}
+        required_keys, optional_keys = _ENTITY_FIELDS[entity_type]
 
         if user_input is not None:
-            # Validate unique entity name
-            entity_id = user_input[CONF_NAME].lower().replace(" ", "_")
-            if self._entity_index is None and any(
-                e.get(CONF_ENTITY_ID) == entity_id for e in self._entities
-            ):
+            # Validate unique entity name; an edited entity may keep its own
+            entity_id = _slugify(user_input[CONF_NAME])
+            editing_id = self._entity_id_to_edit
+            # Duplicate IDs from older versions are stored under another key
+            entity_key = entity_id
+            if editing_id is not None and self._entity_to_edit is not None:
+                if entity_id == self._entity_to_edit.get(CONF_ENTITY_ID):
+                    entity_key = editing_id
+            if entity_key != editing_id and entity_key in self._entities:
                 errors[CONF_NAME] = "entity_exists"
             else:
                 # Build entity configuration
                 entity_config = {
-                    CONF_TYPE: ENTITY_TYPE_COVER,
+                    CONF_TYPE: entity_type,
                     CONF_ENTITY_ID: entity_id,
                     CONF_NAME: user_input[CONF_NAME],
                 }
-                
+                for key in required_keys:
+                    entity_config[key] = user_input[key]
+
                 # Add optional fields only if provided and non-empty
-                if user_input.get(CONF_ADS_VAR):
-                    entity_config[CONF_ADS_VAR] = user_input[CONF_ADS_VAR]
-                if user_input.get(CONF_ADS_VAR_POSITION):
-                    entity_config[CONF_ADS_VAR_POSITION] = user_input[
-                        CONF_ADS_VAR_POSITION
-                    ]
-                if user_input.get(CONF_ADS_VAR_SET_POSITION):
-                    entity_config[CONF_ADS_VAR_SET_POSITION] = user_input[
-                        CONF_ADS_VAR_SET_POSITION
-                    ]
-                if user_input.get(CONF_ADS_VAR_OPEN):
-                    entity_config[CONF_ADS_VAR_OPEN] = user_input[CONF_ADS_VAR_OPEN]
-                if user_input.get(CONF_ADS_VAR_CLOSE):
-                    entity_config[CONF_ADS_VAR_CLOSE] = user_input[CONF_ADS_VAR_CLOSE]
-                if user_input.get(CONF_ADS_VAR_STOP):
-                    entity_config[CONF_ADS_VAR_STOP] = user_input[CONF_ADS_VAR_STOP]
-                if user_input.get(CONF_DEVICE_CLASS):
-                    entity_config[CONF_DEVICE_CLASS] = user_input[CONF_DEVICE_CLASS]
-                
-                if self._entity_index is not None:
-                    # Edit existing entity
-                    self._entities[self._entity_index] = entity_config
+                for key in optional_keys:
+                    if value := user_input.get(key):
+                        entity_config[key] = value
+
+                if editing_id is None or editing_id == entity_key:
+                    # Add new entity, or update an existing one in place
+                    self._entities[entity_key] = entity_config
                 else:
-                    # Add new entity
-                    self._entities.append(entity_config)
-                
+                    # Renamed entity; rebuild to keep its position in the list
+                    self._entities = {
+                        (entity_key if key == editing_id else key): (
+                            entity_config if key == editing_id else entity
+                        )
+                        for key, entity in self._entities.items()
+                    }
+
                 # Reset state and go back to menu
                 self._entity_to_edit = None
-                self._entity_index = None
+                self._entity_id_to_edit = None
                 return await self.async_step_init()
 
         # Get defaults for edit mode
-        defaults = {}
-        if self._entity_to_edit and self._entity_index is not None:
-            defaults = {
-                CONF_NAME: self._entity_to_edit.get(CONF_NAME, ""),
-                CONF_ADS_VAR: self._entity_to_edit.get(CONF_ADS_VAR, ""),
-                CONF_ADS_VAR_POSITION: self._entity_to_edit.get(
-                    CONF_ADS_VAR_POSITION, ""
-                ),
-                CONF_ADS_VAR_SET_POSITION: self._entity_to_edit.get(
-                    CONF_ADS_VAR_SET_POSITION, ""
-                ),
-                CONF_ADS_VAR_OPEN: self._entity_to_edit.get(CONF_ADS_VAR_OPEN, ""),
-                CONF_ADS_VAR_CLOSE: self._entity_to_edit.get(CONF_ADS_VAR_CLOSE, ""),
-                CONF_ADS_VAR_STOP: self._entity_to_edit.get(CONF_ADS_VAR_STOP, ""),
-                CONF_DEVICE_CLASS: self._entity_to_edit.get(CONF_DEVICE_CLASS, ""),
-            }
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR, default=defaults.get(CONF_ADS_VAR, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR_POSITION,
-                    default=defaults.get(CONF_ADS_VAR_POSITION, ""),
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR_SET_POSITION,
-                    default=defaults.get(CONF_ADS_VAR_SET_POSITION, ""),
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR_OPEN, default=defaults.get(CONF_ADS_VAR_OPEN, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR_CLOSE, default=defaults.get(CONF_ADS_VAR_CLOSE, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_ADS_VAR_STOP, default=defaults.get(CONF_ADS_VAR_STOP, "")
-                ): cv.string,
-                vol.Optional(
-                    CONF_DEVICE_CLASS, default=defaults.get(CONF_DEVICE_CLASS, "")
-                ): cv.string,
-            }
-        )
+        defaults = self._edit_defaults((CONF_NAME, *required_keys, *optional_keys))
+        build_schema, add_schema = _ENTITY_SCHEMAS[entity_type]
 
         return self.async_show_form(
-            step_id="configure_cover",
-            data_schema=data_schema,
+            step_id=f"configure_{entity_type}",
+            data_schema=build_schema(defaults) if defaults else add_schema,
             errors=errors,
         )
 
@@ -727,32 +685,19 @@ class AdsOptionsFlowHandler(OptionsFlow):
             return await self.async_step_init()
 
         if user_input is not None:
-            selected_id = user_input["entity_to_edit"]
             # Find the entity by ID
-            for idx, entity in enumerate(self._entities):
-                if entity.get(CONF_ENTITY_ID) == selected_id:
-                    self._entity_index = idx
-                    self._entity_to_edit = entity
-                    
-                    # Route to appropriate configuration step
-                    entity_type = entity.get(CONF_TYPE)
-                    if entity_type == ENTITY_TYPE_SWITCH:
-                        return await self.async_step_configure_switch()
-                    if entity_type == ENTITY_TYPE_LIGHT:
-                        return await self.async_step_configure_light()
-                    if entity_type == ENTITY_TYPE_SENSOR:
-                        return await self.async_step_configure_sensor()
-                    if entity_type == ENTITY_TYPE_BINARY_SENSOR:
-                        return await self.async_step_configure_binary_sensor()
-                    if entity_type == ENTITY_TYPE_COVER:
-                        return await self.async_step_configure_cover()
-                    break
-
-        # Build entity selection dict
-        entity_choices = {
-            entity.get(CONF_ENTITY_ID): f"{entity.get(CONF_NAME)} ({entity.get(CONF_TYPE)})"
-            for entity in self._entities
-        }
+            selected_id = user_input["entity_to_edit"]
+            if (entity := self._entities.get(selected_id)) is not None:
+                self._entity_id_to_edit = selected_id
+                self._entity_to_edit = entity
+
+                # Route to appropriate configuration step
+                if configure_step := self._configure_steps.get(
+                    entity.get(CONF_TYPE)
+                ):
+                    return await configure_step()
+
+        entity_choices = self._build_entity_choices()
 
         data_schema = vol.Schema(
             {
@@ -778,16 +723,10 @@ class AdsOptionsFlowHandler(OptionsFlow):
         if user_input is not None:
             selected_id = user_input["entity_to_remove"]
             # Remove the entity by ID
-            self._entities = [
-                e for e in self._entities if e.get(CONF_ENTITY_ID) != selected_id
-            ]
+            self._entities.pop(selected_id, None)
             return await self.async_step_init()
 
-        # Build entity selection dict
-        entity_choices = {
-            entity.get(CONF_ENTITY_ID): f"{entity.get(CONF_NAME)} ({entity.get(CONF_TYPE)})"
-            for entity in self._entities
-        }
+        entity_choices = self._build_entity_choices()
 
         data_schema = vol.Schema(
             {
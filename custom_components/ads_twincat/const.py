@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+import pyads
+
 from homeassistant.util.hass_dict import HassKey
 
 if TYPE_CHECKING:
@@ -12,7 +15,8 @@ if TYPE_CHECKING:
 
 DOMAIN = "ads_twincat"
 
-DATA_ADS: HassKey[AdsHub] = HassKey(DOMAIN)
+DATA_ADS: HassKey[dict[str, AdsHub]] = HassKey(DOMAIN)
+DATA_PLATFORMS: HassKey[dict[str, list[str]]] = HassKey(f"{DOMAIN}_platforms")
 
 CONF_ADS_VAR = "adsvar"
 
@@ -21,7 +25,9 @@ STATE_KEY_STATE = "state"
 # Connection monitoring constants
 CONF_ADS_VAR_MONITORED = "ads_var_monitored"
 DEFAULT_PORT = 48898
-CONNECTION_RETRY_INTERVAL = [1, 2, 4, 8, 16, 32, 60]  # Exponential backoff in seconds
+# Exponential reconnect backoff bounds in seconds
+CONNECTION_RETRY_MIN_INTERVAL = 1
+CONNECTION_RETRY_MAX_INTERVAL = 60
 
 
 class AdsType(StrEnum):
@@ -44,3 +50,26 @@ class AdsType(StrEnum):
     DATE = "date"
     DATE_AND_TIME = "dt"
     TOD = "tod"
+
+    @cached_property
+    def plc_type(self) -> type:
+        """Return the pyads PLC type, resolved once per member."""
+        return {
+            AdsType.BOOL: pyads.PLCTYPE_BOOL,
+            AdsType.BYTE: pyads.PLCTYPE_BYTE,
+            AdsType.INT: pyads.PLCTYPE_INT,
+            AdsType.UINT: pyads.PLCTYPE_UINT,
+            AdsType.SINT: pyads.PLCTYPE_SINT,
+            AdsType.USINT: pyads.PLCTYPE_USINT,
+            AdsType.DINT: pyads.PLCTYPE_DINT,
+            AdsType.UDINT: pyads.PLCTYPE_UDINT,
+            AdsType.WORD: pyads.PLCTYPE_WORD,
+            AdsType.DWORD: pyads.PLCTYPE_DWORD,
+            AdsType.REAL: pyads.PLCTYPE_REAL,
+            AdsType.LREAL: pyads.PLCTYPE_LREAL,
+            AdsType.STRING: pyads.PLCTYPE_STRING,
+            AdsType.TIME: pyads.PLCTYPE_TIME,
+            AdsType.DATE: pyads.PLCTYPE_DATE,
+            AdsType.DATE_AND_TIME: pyads.PLCTYPE_DT,
+            AdsType.TOD: pyads.PLCTYPE_TOD,
+        }[self]
@@ -57,7 +57,8 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the cover platform for ADS (legacy YAML config)."""
-    ads_hub = hass.data[DATA_ADS]
+    # Legacy YAML platforms use the first configured ADS device
+    ads_hub = next(iter(hass.data[DATA_ADS].values()))
 
     ads_var_is_closed: str | None = config.get(CONF_ADS_VAR)
     ads_var_position: str | None = config.get(CONF_ADS_VAR_POSITION)
@@ -91,13 +92,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ADS cover entities from config entry."""
-    ads_hub = hass.data[DATA_ADS]
+    ads_hub = hass.data[DATA_ADS][entry.entry_id]
     
-    # Get configured entities from options
-    entities = entry.options.get("entities", [])
-    
-    # Filter for cover entities
-    cover_configs = [e for e in entities if e.get("type") == "cover"]
+    # Entities configured in options, grouped by type during entry setup
+    cover_configs = ads_hub.entities_by_type.get("cover", [])
     
     # Create cover entities
     covers = []
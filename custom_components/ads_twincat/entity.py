@@ -5,6 +5,7 @@ from asyncio import timeout
 import logging
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 
 from .const import STATE_KEY_STATE
@@ -12,6 +13,9 @@ from .hub import AdsHub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds over which notifications are coalesced into one state write
+_STATE_WRITE_DELAY = 0.05
+
 
 class AdsEntity(Entity):
     """Representation of ADS entity."""
@@ -22,9 +26,16 @@ class AdsEntity(Entity):
         """Initialize ADS binary sensor."""
         self._state_dict: dict[str, Any] = {}
         self._state_dict[STATE_KEY_STATE] = None
+        # Set once the main state received its first value
+        self._has_value = False
         self._ads_hub = ads_hub
         self._ads_var = ads_var
-        self._event: asyncio.Event | None = None
+        # Created up front so a notification can never find it unset; the
+        # event binds to the running loop on first use, not here
+        self._event = asyncio.Event()
+        # A state write is scheduled; set from the notification thread
+        self._pending_write = False
+        self._write_handle: asyncio.TimerHandle | None = None
         self._attr_unique_id = ads_var
         self._attr_name = name
         self._connection_callback = None
@@ -51,6 +62,16 @@ class AdsEntity(Entity):
         await super().async_will_remove_from_hass()
         if self._connection_callback:
             self._ads_hub.remove_connection_callback(self._connection_callback)
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+    @callback
+    def _async_write_pending_state(self) -> None:
+        """Write the state coalesced from recent notifications."""
+        self._write_handle = None
+        self._pending_write = False
+        self.async_write_ha_state()
 
     async def async_initialize_device(
         self,
@@ -61,24 +82,38 @@ class AdsEntity(Entity):
     ) -> None:
         """Register device notification."""
 
-        def update(name, value):
-            """Handle device notifications."""
-            _LOGGER.debug("Variable %s changed its value to %d", name, value)
-
-            if factor is None:
-                self._state_dict[state_key] = value
-            else:
-                self._state_dict[state_key] = value / factor
-
-            asyncio.run_coroutine_threadsafe(async_event_set(), self.hass.loop)
-            self.schedule_update_ha_state()
-
-        async def async_event_set():
-            """Set event in async context."""
+        @callback
+        def async_update() -> None:
+            """Mark the first update and schedule the state write."""
             self._event.set()
+            if self._write_handle is None:
+                self._write_handle = self.hass.loop.call_later(
+                    _STATE_WRITE_DELAY, self._async_write_pending_state
+                )
 
-        self._event = asyncio.Event()
+        state = self._state_dict
+        sets_state = state_key == STATE_KEY_STATE
 
+        def update(name, value):
+            """Handle device notifications."""
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Variable %s changed its value to %s", name, value)
+
+            # Divide rather than multiply by a reciprocal, which is not exact
+            # for factors such as 10 and would show values like 0.30000000000000004
+            state[state_key] = value if factor is None else value / factor
+            if sets_state:
+                self._has_value = True
+
+            # Bursts of notifications share one hop to the event loop and one
+            # state write, which then picks up the latest values. A variable
+            # still awaiting its first value hops anyway to set the event.
+            if not self._pending_write or not self._event.is_set():
+                self._pending_write = True
+                self.hass.loop.call_soon_threadsafe(async_update)
+
+        # Entities with several variables wait for each one's first value
+        self._event.clear()
         await self.hass.async_add_executor_job(
             self._ads_hub.add_device_notification, ads_var, plctype, update
         )
@@ -91,7 +126,4 @@ class AdsEntity(Entity):
     @property
     def available(self) -> bool:
         """Return False if state has not been updated yet or connection is lost."""
-        return (
-            self._state_dict[STATE_KEY_STATE] is not None
-            and self._ads_hub.connected
-        )
+        return self._has_value and self._ads_hub.connected
@@ -1,23 +1,66 @@
 """Support for Automation Device Specification (ADS) - TwinCAT."""
 
 import asyncio
-from collections import namedtuple
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 import ctypes
+from dataclasses import dataclass
 import logging
+import queue
+import random
 import struct
 import threading
+from time import monotonic
+from typing import Any
 
 import pyads
 
-from .const import CONNECTION_RETRY_INTERVAL
+from .const import CONNECTION_RETRY_MAX_INTERVAL, CONNECTION_RETRY_MIN_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
-# Tuple to hold data needed for notification
-NotificationItem = namedtuple(  # noqa: PYI024
-    "NotificationItem", "hnotify huser name plc_datatype callback"
-)
+
+@dataclass(slots=True, frozen=True)
+class NotificationItem:
+    """Data needed for a device notification."""
+
+    hnotify: int
+    huser: int
+    name: str
+    plc_datatype: type
+    callback: Callable[[str, Any], None]
+
+
+# Precompiled little-endian decoders for notification data by PLC data type
+_UNPACKERS = {
+    pyads.PLCTYPE_BOOL: struct.Struct("<?"),
+    pyads.PLCTYPE_BYTE: struct.Struct("<b"),
+    pyads.PLCTYPE_INT: struct.Struct("<h"),
+    pyads.PLCTYPE_UINT: struct.Struct("<H"),
+    pyads.PLCTYPE_SINT: struct.Struct("<b"),
+    pyads.PLCTYPE_USINT: struct.Struct("<B"),
+    pyads.PLCTYPE_DINT: struct.Struct("<i"),
+    pyads.PLCTYPE_UDINT: struct.Struct("<I"),
+    pyads.PLCTYPE_WORD: struct.Struct("<H"),
+    pyads.PLCTYPE_DWORD: struct.Struct("<I"),
+    pyads.PLCTYPE_LREAL: struct.Struct("<d"),
+    pyads.PLCTYPE_REAL: struct.Struct("<f"),
+    pyads.PLCTYPE_TOD: struct.Struct("<i"),  # Treat as DINT
+    pyads.PLCTYPE_DATE: struct.Struct("<i"),  # Treat as DINT
+    pyads.PLCTYPE_DT: struct.Struct("<i"),  # Treat as DINT
+    pyads.PLCTYPE_TIME: struct.Struct("<i"),  # Treat as DINT
+}
+
+# Offset of the sample data in an ADS notification, and a fast address lookup
+_NOTIF_DATA_OFFSET = pyads.structs.SAdsNotificationHeader.data.offset
+_addressof = ctypes.addressof
+
+# Most queued calls the worker takes from the queue in one pass
+_MAX_BATCH = 64
+# Most notification deletes in flight at once when releasing the hub
+_MAX_PARALLEL_DELETES = 16
+# Queued last when the hub is released, to stop the worker thread
+_STOP = object()
 
 
 class AdsHub:
@@ -28,15 +71,37 @@ class AdsHub:
         self._client = ads_client
         self._hass = hass
         self._connected = False
-        self._connection_callbacks: list[Callable[[bool], None]] = []
+        # Ordered set of callbacks, for O(1) removal
+        self._connection_callbacks: dict[Callable[[bool], None], None] = {}
+        # Immutable copy iterated when notifying, replaced on every change
+        self._connection_callbacks_snapshot: tuple[Callable[[bool], None], ...] = ()
         self._reconnect_task = None
-        self._retry_count = 0
+        # Backoff delay before the next attempt, and when the last one started
+        self._reconnect_delay = CONNECTION_RETRY_MIN_INTERVAL
+        self._last_reconnect_attempt = 0.0
         self._unavailable_logged = False
 
+        # Entity configs from the config entry options, keyed by platform
+        self.entities_by_type: dict[str, list[dict[str, Any]]] = {}
+
         # All ADS devices are registered here
         self._devices = []
+        # Written on the worker thread, read from the notification thread. A
+        # lookup is atomic, so hits need no lock. The first sample can arrive
+        # before its item is stored, so a miss retries under the lock that is
+        # held from subscribing until the item is stored.
         self._notification_items = {}
-        self._lock = threading.Lock()
+        self._notification_lock = threading.Lock()
+
+        # Blocking client calls are queued to one worker thread that owns the
+        # connection, so pending writes can be sent as one sum request
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._submit_lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run_worker, name="ads_hub", daemon=True
+        )
+        self._worker.start()
 
         # Try initial connection
         try:
@@ -46,6 +111,8 @@ class AdsHub:
         except pyads.ADSError as err:
             _LOGGER.error("Failed to connect to ADS device: %s", err)
             self._connected = False
+            # Counts as an attempt, so the first retry waits the minimum delay
+            self._last_reconnect_attempt = monotonic()
             if hass:
                 # Schedule reconnection attempts
                 self._schedule_reconnect()
@@ -57,53 +124,185 @@ class AdsHub:
 
     def add_connection_callback(self, callback: Callable[[bool], None]) -> None:
         """Add a callback to be called when connection state changes."""
-        self._connection_callbacks.append(callback)
+        self._connection_callbacks[callback] = None
+        self._connection_callbacks_snapshot = tuple(self._connection_callbacks)
 
     def remove_connection_callback(self, callback: Callable[[bool], None]) -> None:
         """Remove a connection state callback."""
         if callback in self._connection_callbacks:
-            self._connection_callbacks.remove(callback)
+            del self._connection_callbacks[callback]
+            self._connection_callbacks_snapshot = tuple(self._connection_callbacks)
 
     def _notify_connection_state(self, connected: bool) -> None:
         """Notify all callbacks of connection state change."""
-        for callback in self._connection_callbacks:
+        for callback in self._connection_callbacks_snapshot:
             try:
                 callback(connected)
             except Exception:
                 _LOGGER.exception("Error calling connection callback")
 
+    def _submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Queue a blocking client call for the worker thread."""
+        future: Future = Future()
+        with self._submit_lock:
+            if not self._closed:
+                self._queue.put((func, args, future))
+                return future
+        # The worker is stopped once the hub is released; run in place
+        self._run(func, args, future)
+        return future
+
+    def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking client call on the worker thread and wait for it."""
+        if threading.current_thread() is self._worker:
+            return func(*args)
+        return self._submit(func, *args).result()
+
+    @staticmethod
+    def _run(func: Callable[..., Any], args: tuple, future: Future) -> None:
+        """Run one queued call and hand its outcome to the caller."""
+        try:
+            result = func(*args)
+        except Exception as err:  # noqa: BLE001
+            future.set_exception(err)
+        else:
+            future.set_result(result)
+
+    def _run_worker(self) -> None:
+        """Run queued client calls in order until the hub is released."""
+        write = self._write_by_name
+        while True:
+            batch = [self._queue.get()]
+            # Take whatever else is already pending
+            while len(batch) < _MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Consecutive writes are coalesced; anything else runs on its own
+            writes = []
+            for item in batch:
+                if item is not _STOP and item[0] == write:
+                    writes.append(item)
+                    continue
+                if writes:
+                    self._run_batch(writes)
+                    writes = []
+                if item is _STOP:
+                    return
+                self._run(*item)
+            if writes:
+                self._run_batch(writes)
+
+    def _run_batch(self, writes: list) -> None:
+        """Run queued writes without letting an error end the worker."""
+        try:
+            self._run_writes(writes)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.exception("Unexpected error writing to ADS device")
+            # Unblock every caller still waiting on this batch
+            for _, _, future in writes:
+                if not future.done():
+                    future.set_exception(err)
+
+    def _run_writes(self, writes: list) -> None:
+        """Run queued writes, as one sum request when several are pending."""
+        # A sum request writes each variable once; repeats follow singly
+        values = {}
+        batched = []
+        repeated = []
+        for item in writes:
+            name, value, _ = item[1]
+            if name in values:
+                repeated.append(item)
+            else:
+                values[name] = value
+                batched.append(item)
+
+        if len(batched) > 1 and self._connected:
+            try:
+                # Resolve symbols on every write, like write_by_name does; the
+                # connection outlives reloads and PLC program downloads
+                results = self._client.write_list_by_name(
+                    values, cache_symbol_info=False
+                )
+            except Exception as err:  # noqa: BLE001
+                # pyads also raises ADSError for unknown variables, and KeyError,
+                # struct.error or AttributeError for symbols or values it cannot
+                # convert; the single writes report them
+                _LOGGER.debug("Batched write failed, writing singly: %s", err)
+                results = {}
+            for item in batched:
+                if results.get(item[1][0]) == "no error":
+                    item[2].set_result(None)
+                else:
+                    self._run(*item)
+        else:
+            repeated = writes
+
+        for item in repeated:
+            self._run(*item)
+
+    def _stop_worker(self) -> None:
+        """Stop the worker thread once the calls queued before are done."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        if threading.current_thread() is not self._worker:
+            self._worker.join()
+
+    def _handle_ads_error(self, action: str, name: str, err: pyads.ADSError) -> None:
+        """Log a failed client call and start reconnecting."""
+        _LOGGER.error("Error %s %s: %s", action, name, err)
+        self._connected = False
+        self._last_reconnect_attempt = monotonic()
+        if self._hass:
+            self._schedule_reconnect()
+
     def _schedule_reconnect(self) -> None:
         """Schedule a reconnection attempt."""
-        if not self._hass or self._reconnect_task:
+        # A released hub no longer owns the connection
+        if not self._hass or self._reconnect_task or self._closed:
             return
 
-        # Get retry interval with exponential backoff
-        retry_index = min(self._retry_count, len(CONNECTION_RETRY_INTERVAL) - 1)
-        retry_interval = CONNECTION_RETRY_INTERVAL[retry_index]
+        # Space attempts by the backoff delay, counted from the last attempt,
+        # so failing reads and writes cannot trigger extra attempts early.
+        # Jitter spreads out clients that lost the same PLC at the same time
+        delay = random.uniform(self._reconnect_delay / 2, self._reconnect_delay)
+        retry_interval = max(delay - (monotonic() - self._last_reconnect_attempt), 0)
 
-        _LOGGER.debug("Scheduling reconnection in %s seconds", retry_interval)
+        _LOGGER.debug("Scheduling reconnection in %.1f seconds", retry_interval)
 
         async def reconnect_async():
             """Reconnect to ADS device."""
             await asyncio.sleep(retry_interval)
             self._reconnect_task = None
-            await self._hass.async_add_executor_job(self._try_reconnect)
+            await asyncio.wrap_future(self._submit(self._try_reconnect))
 
         def _create_task():
             """Create the reconnect task on the event loop."""
-            self._reconnect_task = self._hass.async_create_task(reconnect_async())
+            if not self._closed:
+                self._reconnect_task = self._hass.async_create_task(
+                    reconnect_async()
+                )
 
         self._hass.loop.call_soon_threadsafe(_create_task)
 
     def _try_reconnect(self) -> None:
-        """Try to reconnect to ADS device."""
+        """Try to reconnect to ADS device; runs on the worker thread."""
+        if self._closed:
+            return
         try:
             if not self._connected:
+                self._last_reconnect_attempt = monotonic()
                 self._client.open()
                 # Test connection by reading state
                 self._client.read_state()
                 self._connected = True
-                self._retry_count = 0
+                self._reconnect_delay = CONNECTION_RETRY_MIN_INTERVAL
                 _LOGGER.info("Reconnected to ADS device")
                 if self._unavailable_logged:
                     _LOGGER.info("ADS device is back online")
@@ -111,7 +310,9 @@ class AdsHub:
                 self._notify_connection_state(True)
         except pyads.ADSError as err:
             _LOGGER.debug("Reconnection attempt failed: %s", err)
-            self._retry_count += 1
+            self._reconnect_delay = min(
+                self._reconnect_delay * 2, CONNECTION_RETRY_MAX_INTERVAL
+            )
             self._connected = False
             if not self._unavailable_logged:
                 _LOGGER.info("ADS device is unavailable: %s", err)
@@ -122,135 +323,196 @@ class AdsHub:
 
     def check_connection(self) -> bool:
         """Check if connection to ADS device is still alive."""
-        with self._lock:
-            try:
-                self._client.read_state()
-                if not self._connected:
-                    self._connected = True
-                    self._retry_count = 0
-                    _LOGGER.info("ADS connection restored")
-                    if self._unavailable_logged:
-                        _LOGGER.info("ADS device is back online")
-                        self._unavailable_logged = False
-                    self._notify_connection_state(True)
-                return True
-            except pyads.ADSError as err:
-                if self._connected:
-                    _LOGGER.error("Lost connection to ADS device: %s", err)
-                    self._connected = False
-                    if not self._unavailable_logged:
-                        _LOGGER.info("ADS device is unavailable: %s", err)
-                        self._unavailable_logged = True
-                    self._notify_connection_state(False)
-                    if self._hass:
-                        self._schedule_reconnect()
-                return False
+        return self._call(self._check_connection)
+
+    def _check_connection(self) -> bool:
+        """Check the connection; runs on the worker thread."""
+        try:
+            self._client.read_state()
+            if not self._connected:
+                self._connected = True
+                self._reconnect_delay = CONNECTION_RETRY_MIN_INTERVAL
+                _LOGGER.info("ADS connection restored")
+                if self._unavailable_logged:
+                    _LOGGER.info("ADS device is back online")
+                    self._unavailable_logged = False
+                self._notify_connection_state(True)
+            return True
+        except pyads.ADSError as err:
+            if self._connected:
+                _LOGGER.error("Lost connection to ADS device: %s", err)
+                self._connected = False
+                if not self._unavailable_logged:
+                    _LOGGER.info("ADS device is unavailable: %s", err)
+                    self._unavailable_logged = True
+                self._notify_connection_state(False)
+                if self._hass:
+                    self._schedule_reconnect()
+            return False
 
     def shutdown(self, *args, **kwargs):
         """Shutdown ADS connection."""
         _LOGGER.debug("Shutting down ADS")
 
-        # Cancel reconnection task if scheduled
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
-            self._reconnect_task = None
-
-        for notification_item in self._notification_items.values():
-            _LOGGER.debug(
-                "Deleting device notification %d, %d",
-                notification_item.hnotify,
-                notification_item.huser,
-            )
-            try:
-                self._client.del_device_notification(
-                    notification_item.hnotify, notification_item.huser
-                )
-            except pyads.ADSError as err:
-                _LOGGER.error(err)
+        self.release()
         try:
             self._client.close()
             self._connected = False
         except pyads.ADSError as err:
             _LOGGER.error(err)
 
+    def release(self) -> None:
+        """Release notifications and reconnection, leaving the connection open."""
+        # Cancel reconnection task if scheduled; tasks may only be cancelled
+        # on the event loop, and this runs in the executor
+        if (task := self._reconnect_task) is not None:
+            self._reconnect_task = None
+            self._hass.loop.call_soon_threadsafe(task.cancel)
+
+        try:
+            self._call(self._release_notifications)
+        finally:
+            self._stop_worker()
+
+    def _release_notifications(self) -> None:
+        """Delete all device notifications; runs on the worker thread."""
+        items = list(self._notification_items.values())
+        try:
+            if len(items) > 1:
+                # Each delete is a round trip; keep several in flight instead
+                # of waiting for each in turn. Consuming the results re-raises
+                # anything a delete raised besides ADSError.
+                with ThreadPoolExecutor(
+                    max_workers=min(len(items), _MAX_PARALLEL_DELETES),
+                    thread_name_prefix="ads_release",
+                ) as executor:
+                    list(executor.map(self._delete_notification, items))
+            else:
+                for notification_item in items:
+                    self._delete_notification(notification_item)
+        finally:
+            self._notification_items.clear()
+
+    def _delete_notification(self, notification_item: NotificationItem) -> None:
+        """Delete one device notification."""
+        _LOGGER.debug(
+            "Deleting device notification %d, %d",
+            notification_item.hnotify,
+            notification_item.huser,
+        )
+        try:
+            self._client.del_device_notification(
+                notification_item.hnotify, notification_item.huser
+            )
+        except pyads.ADSError as err:
+            _LOGGER.error(err)
+
     def register_device(self, device):
         """Register a new device."""
         self._devices.append(device)
 
     def write_by_name(self, name, value, plc_datatype):
         """Write a value to the device."""
-        with self._lock:
-            try:
-                if not self._connected:
-                    _LOGGER.error("Cannot write %s: not connected", name)
-                    return None
-                return self._client.write_by_name(name, value, plc_datatype)
-            except pyads.ADSError as err:
-                _LOGGER.error("Error writing %s: %s", name, err)
-                self._connected = False
-                if self._hass:
-                    self._schedule_reconnect()
+        # Fail fast without queueing; the worker checks again before writing
+        if not self._connected:
+            _LOGGER.error("Cannot write %s: not connected", name)
+            return None
+        return self._call(self._write_by_name, name, value, plc_datatype)
+
+    def _write_by_name(self, name, value, plc_datatype):
+        """Write a value; runs on the worker thread."""
+        try:
+            if not self._connected:
+                _LOGGER.error("Cannot write %s: not connected", name)
+                return None
+            return self._client.write_by_name(name, value, plc_datatype)
+        except pyads.ADSError as err:
+            self._handle_ads_error("writing", name, err)
+            return None
+
+    def write_list_by_name(self, values):
+        """Write several values to the device in a single request.
+
+        Types are taken from the PLC symbol information. Returns a dict
+        mapping each variable to its ADS status string.
+        """
+        if not self._connected:
+            _LOGGER.error("Cannot write %s: not connected", ", ".join(values))
+            return None
+        return self._call(self._write_list_by_name, values)
+
+    def _write_list_by_name(self, values):
+        """Write several values; runs on the worker thread."""
+        try:
+            if not self._connected:
+                _LOGGER.error("Cannot write %s: not connected", ", ".join(values))
                 return None
+            return self._client.write_list_by_name(values, cache_symbol_info=False)
+        except pyads.ADSError as err:
+            self._handle_ads_error("writing", ", ".join(values), err)
+            return None
 
     def read_by_name(self, name, plc_datatype):
         """Read a value from the device."""
-        with self._lock:
-            try:
-                if not self._connected:
-                    _LOGGER.error("Cannot read %s: not connected", name)
-                    return None
-                return self._client.read_by_name(name, plc_datatype)
-            except pyads.ADSError as err:
-                _LOGGER.error("Error reading %s: %s", name, err)
-                self._connected = False
-                if self._hass:
-                    self._schedule_reconnect()
+        if not self._connected:
+            _LOGGER.error("Cannot read %s: not connected", name)
+            return None
+        return self._call(self._read_by_name, name, plc_datatype)
+
+    def _read_by_name(self, name, plc_datatype):
+        """Read a value; runs on the worker thread."""
+        try:
+            if not self._connected:
+                _LOGGER.error("Cannot read %s: not connected", name)
                 return None
+            return self._client.read_by_name(name, plc_datatype)
+        except pyads.ADSError as err:
+            self._handle_ads_error("reading", name, err)
+            return None
 
     def add_device_notification(self, name, plc_datatype, callback):
         """Add a notification to the ADS devices."""
         attr = pyads.NotificationAttrib(ctypes.sizeof(plc_datatype))
+        self._call(self._add_device_notification, name, attr, plc_datatype, callback)
 
-        with self._lock:
+    def _add_device_notification(self, name, attr, plc_datatype, callback):
+        """Add a notification; runs on the worker thread."""
+        with self._notification_lock:
             try:
                 if not self._connected:
-                    _LOGGER.error("Cannot add notification for %s: not connected", name)
+                    _LOGGER.error(
+                        "Cannot add notification for %s: not connected", name
+                    )
                     return
                 hnotify, huser = self._client.add_device_notification(
                     name, attr, self._device_notification_callback
                 )
             except pyads.ADSError as err:
-                _LOGGER.error("Error subscribing to %s: %s", name, err)
-                self._connected = False
-                if self._hass:
-                    self._schedule_reconnect()
-            else:
-                hnotify = int(hnotify)
-                self._notification_items[hnotify] = NotificationItem(
-                    hnotify, huser, name, plc_datatype, callback
-                )
+                self._handle_ads_error("subscribing to", name, err)
+                return
+            hnotify = int(hnotify)
+            self._notification_items[hnotify] = NotificationItem(
+                hnotify, huser, name, plc_datatype, callback
+            )
 
-                _LOGGER.debug(
-                    "Added device notification %d for variable %s", hnotify, name
-                )
+        _LOGGER.debug("Added device notification %d for variable %s", hnotify, name)
 
     def _device_notification_callback(self, notification, name):
         """Handle device notifications."""
         contents = notification.contents
         hnotify = int(contents.hNotification)
-        _LOGGER.debug("Received notification %d", hnotify)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received notification %d", hnotify)
 
-        # Get dynamically sized data array
+        # Copy the dynamically sized sample out of the notification once
         data_size = contents.cbSampleSize
-        data_address = (
-            ctypes.addressof(contents)
-            + pyads.structs.SAdsNotificationHeader.data.offset
-        )
-        data = (ctypes.c_ubyte * data_size).from_address(data_address)
+        data = ctypes.string_at(_addressof(contents) + _NOTIF_DATA_OFFSET, data_size)
 
-        # Acquire notification item
-        with self._lock:
-            notification_item = self._notification_items.get(hnotify)
+        # Lock-free lookup, locked on a miss; see the note on _notification_items
+        notification_item = self._notification_items.get(hnotify)
+        if notification_item is None:
+            with self._notification_lock:
+                notification_item = self._notification_items.get(hnotify)
 
         if not notification_item:
             _LOGGER.error("Unknown device notification handle: %d", hnotify)
@@ -258,32 +520,10 @@ class AdsHub:
 
         # Data parsing based on PLC data type
         plc_datatype = notification_item.plc_datatype
-        unpack_formats = {
-            pyads.PLCTYPE_BYTE: "<b",
-            pyads.PLCTYPE_INT: "<h",
-            pyads.PLCTYPE_UINT: "<H",
-            pyads.PLCTYPE_SINT: "<b",
-            pyads.PLCTYPE_USINT: "<B",
-            pyads.PLCTYPE_DINT: "<i",
-            pyads.PLCTYPE_UDINT: "<I",
-            pyads.PLCTYPE_WORD: "<H",
-            pyads.PLCTYPE_DWORD: "<I",
-            pyads.PLCTYPE_LREAL: "<d",
-            pyads.PLCTYPE_REAL: "<f",
-            pyads.PLCTYPE_TOD: "<i",  # Treat as DINT
-            pyads.PLCTYPE_DATE: "<i",  # Treat as DINT
-            pyads.PLCTYPE_DT: "<i",  # Treat as DINT
-            pyads.PLCTYPE_TIME: "<i",  # Treat as DINT
-        }
-
-        if plc_datatype == pyads.PLCTYPE_BOOL:
-            value = bool(struct.unpack("<?", bytearray(data))[0])
+        if (unpacker := _UNPACKERS.get(plc_datatype)) is not None:
+            value = unpacker.unpack_from(data)[0]
         elif plc_datatype == pyads.PLCTYPE_STRING:
-            value = (
-                bytearray(data).split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
-            )
-        elif plc_datatype in unpack_formats:
-            value = struct.unpack(unpack_formats[plc_datatype], bytearray(data))[0]
+            value = data.partition(b"\x00")[0].decode("utf-8", errors="ignore")
         else:
             value = bytearray(data)
             _LOGGER.warning("No callback available for this datatype")
@@ -44,7 +44,8 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the light platform for ADS (legacy YAML config)."""
-    ads_hub = hass.data[DATA_ADS]
+    # Legacy YAML platforms use the first configured ADS device
+    ads_hub = next(iter(hass.data[DATA_ADS].values()))
 
     ads_var_enable: str = config[CONF_ADS_VAR]
     ads_var_brightness: str | None = config.get(CONF_ADS_VAR_BRIGHTNESS)
@@ -59,13 +60,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ADS light entities from config entry."""
-    ads_hub = hass.data[DATA_ADS]
+    ads_hub = hass.data[DATA_ADS][entry.entry_id]
     
-    # Get configured entities from options
-    entities = entry.options.get("entities", [])
-    
-    # Filter for light entities
-    light_configs = [e for e in entities if e.get("type") == "light"]
+    # Entities configured in options, grouped by type during entry setup
+    light_configs = ads_hub.entities_by_type.get("light", [])
     
     # Create light entities
     lights = []
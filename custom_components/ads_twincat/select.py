@@ -39,7 +39,8 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up an ADS select device."""
-    ads_hub = hass.data[DATA_ADS]
+    # Legacy YAML platforms use the first configured ADS device
+    ads_hub = next(iter(hass.data[DATA_ADS].values()))
 
     ads_var: str = config[CONF_ADS_VAR]
     name: str = config[CONF_NAME]
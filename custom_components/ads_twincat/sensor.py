@@ -20,7 +20,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 
-from . import ADS_TYPEMAP, CONF_ADS_FACTOR, CONF_ADS_TYPE
+from . import CONF_ADS_FACTOR, CONF_ADS_TYPE
 from .const import CONF_ADS_VAR, DATA_ADS, STATE_KEY_STATE, AdsType
 from .entity import AdsEntity
 from .hub import AdsHub
@@ -65,7 +65,8 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up an ADS sensor device (legacy YAML config)."""
-    ads_hub = hass.data[DATA_ADS]
+    # Legacy YAML platforms use the first configured ADS device
+    ads_hub = next(iter(hass.data[DATA_ADS].values()))
 
     ads_var: str = config[CONF_ADS_VAR]
     ads_type: AdsType = config[CONF_ADS_TYPE]
@@ -95,13 +96,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ADS sensor entities from config entry."""
-    ads_hub = hass.data[DATA_ADS]
+    ads_hub = hass.data[DATA_ADS][entry.entry_id]
     
-    # Get configured entities from options
-    entities = entry.options.get("entities", [])
-    
-    # Filter for sensor entities
-    sensor_configs = [e for e in entities if e.get("type") == "sensor"]
+    # Entities configured in options, grouped by type during entry setup
+    sensor_configs = ads_hub.entities_by_type.get("sensor", [])
     
     # Create sensor entities
     sensors = []
@@ -149,7 +147,8 @@ class AdsSensor(AdsEntity, SensorEntity):
     ) -> None:
         """Initialize AdsSensor entity."""
         super().__init__(ads_hub, name, ads_var)
-        self._ads_type = ads_type
+        # Options store the type as a plain string
+        self._ads_type = AdsType(ads_type)
         self._factor = factor
         self._attr_device_class = device_class
         self._attr_state_class = state_class
@@ -159,7 +158,7 @@ class AdsSensor(AdsEntity, SensorEntity):
         """Register device notification."""
         await self.async_initialize_device(
             self._ads_var,
-            ADS_TYPEMAP[self._ads_type],
+            self._ads_type.plc_type,
             STATE_KEY_STATE,
             self._factor,
         )
@@ -38,7 +38,8 @@ def setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up switch platform for ADS (legacy YAML config)."""
-    ads_hub = hass.data[DATA_ADS]
+    # Legacy YAML platforms use the first configured ADS device
+    ads_hub = next(iter(hass.data[DATA_ADS].values()))
 
     name: str = config[CONF_NAME]
     ads_var: str = config[CONF_ADS_VAR]
@@ -52,13 +53,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ADS switch entities from config entry."""
-    ads_hub = hass.data[DATA_ADS]
+    ads_hub = hass.data[DATA_ADS][entry.entry_id]
     
-    # Get configured entities from options
-    entities = entry.options.get("entities", [])
-    
-    # Filter for switch entities
-    switch_configs = [e for e in entities if e.get("type") == "switch"]
+    # Entities configured in options, grouped by type during entry setup
+    switch_configs = ads_hub.entities_by_type.get("switch", [])
     
     # Create switch entities
     switches = []